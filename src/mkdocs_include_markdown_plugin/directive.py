@@ -19,6 +19,9 @@ from mkdocs_include_markdown_plugin.logger import logger
 
 @dataclass
 class DirectiveBoolArgument:  # noqa: D101
+    # created for every boolean option of every directive with arguments
+    __slots__ = ('value', 'regex')
+
     value: bool
     regex: re.Pattern[str]
 
@@ -47,22 +50,41 @@ if TYPE_CHECKING:  # pragma: no cover
 GLOB_FLAGS = glob.NEGATE | glob.EXTGLOB | glob.GLOBSTAR | glob.BRACE
 RE_ESCAPED_PUNCTUATION = re.escape(string.punctuation)
 
+# Characters allowed in the value of non quoted arguments. Invalid values
+# are matched too so they can be reported to the user.
+ARGUMENT_VALUE_CHARS_RE = rf'[{RE_ESCAPED_PUNCTUATION}\w]'
+
 DOUBLE_QUOTED_STR_RE = r'([^"]|(?<=\\)")+'
 SINGLE_QUOTED_STR_RE = r"([^']|(?<=\\)')+"
 
-# In the following regular expression, the substrings "$OPENING_TAG"
-# and "$CLOSING_TAG" will be replaced by the effective opening and
-# closing tags in the `on_config` plugin event.
-INCLUDE_TAG_RE = rf'''
-    (?P<_includer_indent>[ \t\w\\.]*?)$OPENING_TAG
-    \s*
-    include
-    \s+
-    (?:"(?P<double_quoted_filename>{DOUBLE_QUOTED_STR_RE})")?(?:'(?P<single_quoted_filename>{SINGLE_QUOTED_STR_RE})')?
-    (?P<arguments>.*?)
-    \s*
-    $CLOSING_TAG
-'''  # noqa: E501
+# In the following regular expression, the substrings "$OPENING_TAG",
+# "$CLOSING_TAG" and "$DIRECTIVE" will be replaced by the effective opening
+# and closing tags and the directive name in `create_include_tag`.
+#
+# The expression is not verbose and arguments are matched with `[\s\S]`
+# instead of compiling with `re.DOTALL`, so the engine only runs over
+# character classes.
+#
+# The includer indentation can only start where the previous character
+# is not part of it. Otherwise, the lazy indentation class would be tried
+# again from every position of a long run of word characters not followed
+# by the opening tag, which is quadratic in the length of the run.
+# Substitutions resume right after the closing tag of the previous
+# directive, so a directive can also start there, even when the closing
+# tag ends with a character of the indentation.
+INCLUDE_TAG_RE = (
+    r'(?:(?<![ \t\w\\.])|(?<=$CLOSING_TAG))'
+    r'(?P<_includer_indent>[ \t\w\\.]*?)'
+    r'$OPENING_TAG\s*$DIRECTIVE\s+'
+    rf'(?:"(?P<double_quoted_filename>{DOUBLE_QUOTED_STR_RE})")?'
+    rf"(?:'(?P<single_quoted_filename>{SINGLE_QUOTED_STR_RE})')?"
+    r'(?P<arguments>[\s\S]*?)\s*$CLOSING_TAG'
+)
+
+STRING_ARGUMENT_VALUE_RE = (
+    rf'(?:"(?P<double_quoted_value>{DOUBLE_QUOTED_STR_RE})")?'
+    rf"(?:'(?P<single_quoted_value>{SINGLE_QUOTED_STR_RE})')?"
+)
 
 TRUE_FALSE_STR_BOOL = {
     'true': True,
@@ -78,38 +100,58 @@ TRUE_FALSE_BOOL_STR = {
 @functools.lru_cache
 def arg(arg: str) -> re.Pattern[str]:
     """Return a compiled regexp to match a boolean argument."""
-    return re.compile(rf'{arg}=([{RE_ESCAPED_PUNCTUATION}\w]*)')
+    return re.compile(rf'{arg}=({ARGUMENT_VALUE_CHARS_RE}*)')
 
 
 @functools.lru_cache
 def str_arg(arg: str) -> re.Pattern[str]:
     """Return a compiled regexp to match a string argument."""
-    return re.compile(
-        rf'{arg}=(?:"({DOUBLE_QUOTED_STR_RE})")?'
-        rf"(?:'({SINGLE_QUOTED_STR_RE})')?",
-    )
+    return re.compile(rf'{arg}={STRING_ARGUMENT_VALUE_RE}')
 
 
+# Compiled once at import time, instead of on each directive match.
 ARGUMENT_REGEXES = {
-    'start': functools.partial(str_arg, 'start'),
-    'end': functools.partial(str_arg, 'end'),
-    'exclude': functools.partial(str_arg, 'exclude'),
-    'encoding': functools.partial(str_arg, 'encoding'),
+    'start': str_arg('start'),
+    'end': str_arg('end'),
+    'exclude': str_arg('exclude'),
+    'encoding': str_arg('encoding'),
 
     # bool
-    'comments': functools.partial(arg, 'comments'),
-    'preserve-includer-indent': functools.partial(
-        arg, 'preserve-includer-indent',
-    ),
-    'dedent': functools.partial(arg, 'dedent'),
-    'trailing-newlines': functools.partial(arg, 'trailing-newlines'),
-    'rewrite-relative-urls': functools.partial(arg, 'rewrite-relative-urls'),
-    'recursive': functools.partial(arg, 'recursive'),
+    'comments': arg('comments'),
+    'preserve-includer-indent': arg('preserve-includer-indent'),
+    'dedent': arg('dedent'),
+    'trailing-newlines': arg('trailing-newlines'),
+    'rewrite-relative-urls': arg('rewrite-relative-urls'),
+    'recursive': arg('recursive'),
 
     # int
-    'heading-offset': functools.partial(arg, 'heading-offset'),
+    'heading-offset': arg('heading-offset'),
 }
 
+BOOL_ARGUMENT_NAMES = (
+    'comments',
+    'preserve-includer-indent',
+    'dedent',
+    'trailing-newlines',
+    'rewrite-relative-urls',
+    'recursive',
+)
+
+# All boolean arguments are matched at once to scan the arguments string
+# only one time, instead of searching it once per boolean argument.
+BOOL_ARGUMENTS_REGEX = re.compile(
+    rf'({"|".join(map(re.escape, BOOL_ARGUMENT_NAMES))})'
+    rf'=({ARGUMENT_VALUE_CHARS_RE}*)',
+)
+
+STRING_ARGUMENT_NAMES = ('start', 'end', 'exclude', 'encoding')
+
+# Same for string arguments. Quoted values are consumed by their match, so
+# other argument names inside them are not taken as arguments.
+STRING_ARGUMENTS_REGEX = re.compile(
+    rf'({"|".join(STRING_ARGUMENT_NAMES)})={STRING_ARGUMENT_VALUE_RE}',
+)
+
 INCLUDE_DIRECTIVE_ARGS = {
     key for key in ARGUMENT_REGEXES if key not in (
         'rewrite-relative-urls', 'heading-offset', 'comments',
@@ -117,7 +159,7 @@ INCLUDE_DIRECTIVE_ARGS = {
 }
 
 WARN_INVALID_DIRECTIVE_ARGS_REGEX = re.compile(
-    rf'[\w-]*=[{RE_ESCAPED_PUNCTUATION}\w]*',
+    rf'[\w-]*={ARGUMENT_VALUE_CHARS_RE}*',
 )
 
 
@@ -129,6 +171,9 @@ def warn_invalid_directive_arguments(
     docs_dir: str,
 ) -> None:
     """Warns about the invalid arguments passed to a directive."""
+    if '=' not in arguments_string:
+        # all arguments are passed as `name=value`
+        return
     valid_args = (
         INCLUDE_DIRECTIVE_ARGS if directive == 'include'
         else set(ARGUMENT_REGEXES)
@@ -155,21 +200,40 @@ def parse_filename_argument(
         raw_filename = match['single_quoted_filename']
         if raw_filename is None:
             filename = None
-        else:
+        elif '\\' in raw_filename:
             filename = raw_filename.replace("\\'", "'")
-    else:
+        else:
+            filename = raw_filename
+    elif '\\' in raw_filename:
         filename = raw_filename.replace('\\"', '"')
+    else:
+        filename = raw_filename
     return filename, raw_filename
 
 
+def parse_string_arguments(arguments_string: str) -> dict[str, re.Match[str]]:
+    """Return the matches of the string arguments by argument name.
+
+    Only the first occurrence of each argument is returned.
+    """
+    string_arguments: dict[str, re.Match[str]] = {}
+    if '=' not in arguments_string:
+        return string_arguments
+    for match in STRING_ARGUMENTS_REGEX.finditer(arguments_string):
+        string_arguments.setdefault(match[1], match)
+    return string_arguments
+
+
 def parse_string_argument(match: re.Match[str]) -> str | None:
     """Return the string argument matched by ``match``."""
-    value = match[1]
+    # escaped quotes are only unescaped when there is a backslash to avoid
+    # copying the value in the common case
+    value = match['double_quoted_value']
     if value is None:
-        value = match[3]
-        if value is not None:
+        value = match['single_quoted_value']
+        if value is not None and '\\' in value:
             value = value.replace("\\'", "'")
-    else:
+    elif '\\' in value:
         value = value.replace('\\"', '"')
     return value
 
@@ -179,52 +243,149 @@ def create_include_tag(
 ) -> re.Pattern[str]:
     """Create a regex pattern to match an inclusion tag directive.
 
-    Replaces the substrings '$OPENING_TAG' and '$CLOSING_TAG' from
-    INCLUDE_TAG_RE by the effective tag.
+    Replaces the substrings '$OPENING_TAG', '$CLOSING_TAG' and
+    '$DIRECTIVE' from INCLUDE_TAG_RE by the effective tags.
     """
     return re.compile(
-        INCLUDE_TAG_RE.replace(' include', f' {tag}', 1).replace(
+        INCLUDE_TAG_RE.replace('$DIRECTIVE', tag, 1).replace(
             '$OPENING_TAG', re.escape(opening_tag), 1,
-        ).replace('$CLOSING_TAG', re.escape(closing_tag), 1),
-        flags=re.VERBOSE | re.DOTALL,
+        ).replace('$CLOSING_TAG', re.escape(closing_tag)),
     )
 
 
+@functools.lru_cache(maxsize=32)
+def create_include_or_include_markdown_tag(
+        opening_tag: str,
+        closing_tag: str,
+        include_tag: str,
+        include_markdown_tag: str,
+) -> re.Pattern[str]:
+    """Create a regex pattern to match both inclusion tag directives.
+
+    The group 'include_markdown_directive' is only matched by
+    'include-markdown' directives.
+    """
+    return create_include_tag(
+        opening_tag,
+        closing_tag,
+        f'(?:(?P<include_markdown_directive>{include_markdown_tag})'
+        f'|{include_tag})',
+    )
+
+
+@functools.lru_cache
+def _default_bool_options(
+        option_names: tuple[str, ...],
+        default_values: tuple[bool, ...],
+) -> DirectiveBoolArgumentsDict:
+    return {
+        option_name: DirectiveBoolArgument(
+            value=default_value,
+            regex=ARGUMENT_REGEXES[option_name],
+        )
+        for option_name, default_value in zip(option_names, default_values)
+    }
+
+
 def parse_bool_options(
-        option_names: list[str],
+        option_names: tuple[str, ...],
         defaults: DefaultValues,
         arguments_string: str,
 ) -> tuple[DirectiveBoolArgumentsDict, list[str]]:
-    """Parse boolean options from arguments string."""
+    """Parse boolean options from arguments string.
+
+    When no arguments are passed the returned options are shared between
+    calls, so they must not be mutated.
+    """
+    if '=' not in arguments_string:
+        # fast path, common for directives without arguments
+        return _default_bool_options(
+            option_names,
+            tuple(
+                defaults[option_name]  # type: ignore
+                for option_name in option_names
+            ),
+        ), []
+
     invalid_args: list[str] = []
 
+    # only the first occurrence of each argument is taken into account
+    raw_values: dict[str, str] = {}
+    for bool_arg_match in BOOL_ARGUMENTS_REGEX.finditer(arguments_string):
+        raw_values.setdefault(bool_arg_match[1], bool_arg_match[2])
+
     bool_options: dict[str, DirectiveBoolArgument] = {}
     for option_name in option_names:
-        bool_options[option_name] = DirectiveBoolArgument(
+        arg = DirectiveBoolArgument(
             value=defaults[option_name],  # type: ignore
-            regex=ARGUMENT_REGEXES[option_name](),
+            regex=ARGUMENT_REGEXES[option_name],
         )
-
-    for arg_name, arg in bool_options.items():
-        bool_arg_match = arg.regex.search(arguments_string)
-        if bool_arg_match is None:
+        bool_options[option_name] = arg
+        raw_value = raw_values.get(option_name)
+        if raw_value is None:
             continue
         try:
-            bool_options[arg_name].value = TRUE_FALSE_STR_BOOL[
-                bool_arg_match[1] or TRUE_FALSE_BOOL_STR[arg.value]
+            arg.value = TRUE_FALSE_STR_BOOL[
+                raw_value or TRUE_FALSE_BOOL_STR[arg.value]
             ]
         except KeyError:
-            invalid_args.append(arg_name)
+            invalid_args.append(option_name)
     return bool_options, invalid_args
 
 
-def resolve_file_paths_to_include(  # noqa: PLR0912
+@functools.lru_cache(maxsize=1024)
+def includer_page_dir(includer_page_src_path: str) -> str:
+    """Return the absolute directory of an includer page.
+
+    Cached because it is computed for every directive with a relative
+    path, while it is the same for all the directives of a page. The
+    cache is cleared at the start of each build.
+    """
+    return os.path.abspath(os.path.dirname(includer_page_src_path))
+
+
+def _resolve_file_paths_from_root_dir(
+    include_string: str,
+    root_dir: str,
+    ignore_paths: tuple[str, ...],
+) -> list[str]:
+    include_path = os.path.join(root_dir, include_string)
+    try:
+        is_file = stat.S_ISREG(os.stat(include_path).st_mode)
+    except (FileNotFoundError, OSError):
+        is_file = False
+    if is_file:
+        return process.filter_paths([include_path], ignore_paths)
+
+    # globbed paths are filtered as they are found, without collecting
+    # them in an intermediate list
+    root_dir_prefix = os.path.join(root_dir, '')
+    return process.filter_paths(
+        (
+            root_dir_prefix + fp for fp in glob.iglob(
+                include_string,
+                flags=GLOB_FLAGS,
+                root_dir=root_dir,
+            )
+        ),
+        ignore_paths,
+    )
+
+
+# Resolved file paths are cached during a build to avoid walking the
+# filesystem again when the same paths are included or excluded from
+# several directives. These caches are cleared at the start of each build.
+@functools.lru_cache(maxsize=4096)
+def resolve_file_paths_to_include(  # noqa: PLR0911
     include_string: str,
     includer_page_src_path: str | None,
     docs_dir: str,
-    ignore_paths: list[str],
+    ignore_paths: tuple[str, ...],
 ) -> tuple[list[str], bool]:
-    """Resolve the file paths to include for a directive."""
+    """Resolve the file paths to include for a directive.
+
+    The returned list is shared between calls, so it must not be mutated.
+    """
     if process.is_url(include_string):
         return [include_string], True
 
@@ -260,52 +421,30 @@ def resolve_file_paths_to_include(  # noqa: PLR0912
                 ' source path is not provided. The include string'
                 f" '{include_string}' is located inside a generated page.",
             )
-        root_dir = os.path.abspath(
-            os.path.dirname(includer_page_src_path),
-        )
-        paths = []
-        include_path = os.path.join(root_dir, include_string)
-        try:
-            is_file = stat.S_ISREG(os.stat(include_path).st_mode)
-        except (FileNotFoundError, OSError):
-            is_file = False
-        if is_file:
-            paths.append(include_path)
-        else:
-            for fp in glob.iglob(
-                include_string,
-                flags=GLOB_FLAGS,
-                root_dir=root_dir,
-            ):
-                paths.append(os.path.join(root_dir, fp))
-        return process.filter_paths(paths, ignore_paths), False
+        return _resolve_file_paths_from_root_dir(
+            include_string,
+            includer_page_dir(includer_page_src_path),
+            ignore_paths,
+        ), False
 
     # relative to docs_dir
-    paths = []
-    root_dir = docs_dir
-    include_path = os.path.join(root_dir, include_string)
-    try:
-        is_file = stat.S_ISREG(os.stat(include_path).st_mode)
-    except (FileNotFoundError, OSError):
-        is_file = False
-    if is_file:
-        paths.append(include_path)
-    else:
-        for fp in glob.iglob(
-            include_string,
-            flags=GLOB_FLAGS,
-            root_dir=root_dir,
-        ):
-            paths.append(os.path.join(root_dir, fp))
-    return process.filter_paths(paths, ignore_paths), False
+    return _resolve_file_paths_from_root_dir(
+        include_string,
+        docs_dir,
+        ignore_paths,
+    ), False
 
 
+@functools.lru_cache(maxsize=4096)
 def resolve_file_paths_to_exclude(
     exclude_string: str,
     includer_page_src_path: str | None,
     docs_dir: str,
 ) -> list[str]:
-    """Resolve the file paths to exclude for a directive."""
+    """Resolve the file paths to exclude for a directive.
+
+    The returned list is shared between calls, so it must not be mutated.
+    """
     if process.is_absolute_path(exclude_string):
         return glob.glob(exclude_string, flags=GLOB_FLAGS)
 
@@ -316,13 +455,11 @@ def resolve_file_paths_to_exclude(
                 ' source path is not provided. The exclude string'
                 f" '{exclude_string}' is located inside a generated page.",
             )
-        root_dir = os.path.abspath(
-            os.path.dirname(includer_page_src_path),
-        )
+        root_dir = includer_page_dir(includer_page_src_path)
+        root_dir_prefix = os.path.join(root_dir, '')
         return [
-            os.path.normpath(
-                os.path.join(root_dir, fp),
-            ) for fp in glob.glob(
+            os.path.normpath(root_dir_prefix + fp)
+            for fp in glob.glob(
                 exclude_string,
                 flags=GLOB_FLAGS,
                 root_dir=root_dir,
@@ -334,3 +471,30 @@ def resolve_file_paths_to_exclude(
         flags=GLOB_FLAGS,
         root_dir=docs_dir,
     )
+
+
+@functools.lru_cache(maxsize=32)
+def resolve_file_paths_to_exclude_from_settings(
+    exclude: tuple[str, ...],
+    docs_dir: str,
+) -> tuple[str, ...]:
+    """Resolve the file paths to exclude by the ``exclude`` global setting."""
+    if not exclude:
+        return ()
+    return tuple(glob.glob(
+        [
+            os.path.join(docs_dir, fp)
+            if not os.path.isabs(fp)
+            else fp for fp in exclude
+        ],
+        flags=GLOB_FLAGS,
+        root_dir=docs_dir,
+    ))
+
+
+def clear_file_paths_caches() -> None:
+    """Clear the caches of resolved file paths to include and exclude."""
+    includer_page_dir.cache_clear()
+    resolve_file_paths_to_include.cache_clear()
+    resolve_file_paths_to_exclude.cache_clear()
+    resolve_file_paths_to_exclude_from_settings.cache_clear()
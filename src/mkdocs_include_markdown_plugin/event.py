@@ -4,25 +4,23 @@ from __future__ import annotations
 
 import functools
 import html
-import os
 import re
-import textwrap
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, TypeVar
 
 from mkdocs.exceptions import PluginError
-from wcmatch import glob
 
 from mkdocs_include_markdown_plugin import process
 from mkdocs_include_markdown_plugin.cache import Cache
 from mkdocs_include_markdown_plugin.directive import (
     ARGUMENT_REGEXES,
-    GLOB_FLAGS,
-    create_include_tag,
+    create_include_or_include_markdown_tag,
     parse_bool_options,
     parse_filename_argument,
     parse_string_argument,
+    parse_string_arguments,
     resolve_file_paths_to_exclude,
+    resolve_file_paths_to_exclude_from_settings,
     resolve_file_paths_to_include,
     warn_invalid_directive_arguments,
 )
@@ -31,6 +29,7 @@ from mkdocs_include_markdown_plugin.logger import logger
 
 
 if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Callable
     from typing import Literal, TypedDict
 
     from mkdocs.structure.pages import Page
@@ -40,18 +39,21 @@ if TYPE_CHECKING:  # pragma: no cover
 
     IncludeTags = TypedDict(
         'IncludeTags', {
-            'include': re.Pattern[str],
-            'include-markdown': re.Pattern[str],
+            'include-or-include-markdown': re.Pattern[str],
         },
     )
 
 
+_T = TypeVar('_T')
+
+
 # Placeholders (taken from Python-Markdown)
 STX = '\u0002'
 ''' "Start of Text" marker for placeholder templates. '''
 ETX = '\u0003'
 ''' "End of Text" marker for placeholder templates. '''
 INLINE_PLACEHOLDER_PREFIX = f'{STX}klzzwxh:'
+PLACEHOLDER_RE = re.compile(rf'{INLINE_PLACEHOLDER_PREFIX}im?\d+{ETX}')
 
 
 def build_placeholder(
@@ -65,7 +67,11 @@ def build_placeholder(
 
 @dataclass
 class Settings:  # noqa: D101
-    exclude: list[str] | None
+    # file paths excluded by the `exclude` global setting, resolved once
+    # per build
+    ignore_paths: tuple[str, ...]
+    # directives can't be found in contents without this tag
+    opening_tag: str
 
 
 def get_file_content(  # noqa: PLR0913, PLR0915
@@ -81,22 +87,54 @@ def get_file_content(  # noqa: PLR0913, PLR0915
         cumulative_heading_offset: int = 0,
         files_watcher: FilesWatcher | None = None,
         http_cache: Cache | None = None,
+        files_contents: dict[tuple[str, str], str] | None = None,
 ) -> str:
-    """Return the content of the file to include."""
-    if settings.exclude:
-        settings_ignore_paths = list(glob.glob(
-            [
-                os.path.join(docs_dir, fp)
-                if not os.path.isabs(fp)
-                else fp for fp in settings.exclude
-            ],
-            flags=GLOB_FLAGS,
-            root_dir=docs_dir,
-        ))
-        if page_src_path in settings_ignore_paths:
-            return markdown
-    else:
-        settings_ignore_paths = []
+    """Return the content of the file to include.
+
+    The contents of the files read are stored in ``files_contents`` by
+    path and encoding, so each file is read only once per build.
+    """
+    settings_ignore_paths = settings.ignore_paths
+    if page_src_path in settings_ignore_paths or (
+            settings.opening_tag not in markdown
+    ):
+        return markdown
+
+    if files_contents is None:
+        files_contents = {}
+
+    def read_file_or_url(
+            file_path: str, encoding: str, *, is_url: bool,
+    ) -> str:
+        content = files_contents.get((file_path, encoding))
+        if content is None:
+            if is_url:
+                content = process.read_url(file_path, http_cache, encoding)
+            else:
+                content = process.read_file(file_path, encoding)
+            files_contents[(file_path, encoding)] = content
+        return content
+
+    def parse_string_argument_or_default(
+            string_arguments: dict[str, re.Match[str]],
+            argument_name: str,
+            default: _T,
+            directive: Literal['include', 'include-markdown'],
+            directive_lineno: Callable[[], int],
+    ) -> str | _T:
+        argument_match = string_arguments.get(argument_name)
+        if argument_match is None:
+            return default
+        value = parse_string_argument(argument_match)
+        if value is None:
+            location = process.file_lineno_message(
+                page_src_path, docs_dir, directive_lineno(),
+            )
+            raise PluginError(
+                f"Invalid empty '{argument_name}' argument in '{directive}'"
+                f' directive at {location}',
+            )
+        return value
 
     new_found_include_contents: list[tuple[str, str]] = []
     new_found_include_markdown_contents: list[tuple[str, str]] = []
@@ -105,11 +143,12 @@ def get_file_content(  # noqa: PLR0913, PLR0915
             match: re.Match[str],
     ) -> str:
         directive_match_start = match.start()
-        directive_lineno = functools.partial(
-            process.lineno_from_content_start,
-            markdown,
-            directive_match_start,
-        )
+
+        @functools.cache
+        def directive_lineno() -> int:
+            return process.lineno_from_content_start(
+                markdown, directive_match_start,
+            )
 
         includer_indent = match['_includer_indent']
 
@@ -132,24 +171,23 @@ def get_file_content(  # noqa: PLR0913, PLR0915
             page_src_path,
             docs_dir,
         )
+        string_arguments = parse_string_arguments(arguments_string)
 
-        exclude_match = ARGUMENT_REGEXES['exclude']().search(arguments_string)
-        ignore_paths = [*settings_ignore_paths]
-        if exclude_match is not None:
-            exclude_string = parse_string_argument(exclude_match)
-            if exclude_string is None:
-                location = process.file_lineno_message(
-                    page_src_path, docs_dir, directive_lineno(),
-                )
-                raise PluginError(
-                    "Invalid empty 'exclude' argument in 'include'"
-                    f' directive at {location}',
-                )
-
-            for path in resolve_file_paths_to_exclude(
-                exclude_string, page_src_path, docs_dir,
-            ):
-                ignore_paths.append(path)
+        exclude_string = parse_string_argument_or_default(
+            string_arguments,
+            'exclude',
+            None,
+            'include',
+            directive_lineno,
+        )
+        ignore_paths = settings_ignore_paths
+        if exclude_string is not None:
+            ignore_paths = (
+                *settings_ignore_paths,
+                *resolve_file_paths_to_exclude(
+                    exclude_string, page_src_path, docs_dir,
+                ),
+            )
 
         file_paths_to_include, is_url = resolve_file_paths_to_include(
             filename,
@@ -170,8 +208,8 @@ def get_file_content(  # noqa: PLR0913, PLR0915
             files_watcher.included_files.extend(file_paths_to_include)
 
         bool_options, invalid_bool_args = parse_bool_options(
-            ['preserve-includer-indent', 'dedent',
-                'trailing-newlines', 'recursive'],
+            ('preserve-includer-indent', 'dedent',
+                'trailing-newlines', 'recursive'),
             defaults,
             arguments_string,
         )
@@ -185,70 +223,49 @@ def get_file_content(  # noqa: PLR0913, PLR0915
                 f' Possible values are true or false.',
             )
 
-        start_match = ARGUMENT_REGEXES['start']().search(arguments_string)
-        if start_match:
-            start = parse_string_argument(start_match)
-            if start is None:
-                location = process.file_lineno_message(
-                    page_src_path, docs_dir, directive_lineno(),
-                )
-                raise PluginError(
-                    "Invalid empty 'start' argument in 'include' directive at"
-                    f' {location}',
-                )
-        else:
-            start = defaults['start']
+        start = parse_string_argument_or_default(
+            string_arguments,
+            'start',
+            defaults['start'],
+            'include',
+            directive_lineno,
+        )
 
-        end_match = ARGUMENT_REGEXES['end']().search(arguments_string)
-        if end_match:
-            end = parse_string_argument(end_match)
-            if end is None:
-                location = process.file_lineno_message(
-                    page_src_path, docs_dir, directive_lineno(),
-                )
-                raise PluginError(
-                    "Invalid empty 'end' argument in 'include' directive at"
-                    f' {location}',
-                )
-        else:
-            end = defaults['end']
+        end = parse_string_argument_or_default(
+            string_arguments,
+            'end',
+            defaults['end'],
+            'include',
+            directive_lineno,
+        )
 
-        encoding_match = ARGUMENT_REGEXES['encoding']().search(
-            arguments_string)
-        if encoding_match:
-            encoding = parse_string_argument(encoding_match)
-            if encoding is None:
-                location = process.file_lineno_message(
-                    page_src_path, docs_dir, directive_lineno(),
-                )
-                raise PluginError(
-                    "Invalid empty 'encoding' argument in 'include'"
-                    f' directive at {location}',
-                )
-        else:
-            encoding = defaults['encoding']
+        encoding = parse_string_argument_or_default(
+            string_arguments,
+            'encoding',
+            defaults['encoding'],
+            'include',
+            directive_lineno,
+        )
 
-        text_to_include = ''
+        texts_to_include: list[str] = []
         expected_but_any_found = [start is not None, end is not None]
         for file_path in file_paths_to_include:
-            if process.is_url(filename):
-                new_text_to_include = process.read_url(
-                    file_path, http_cache, encoding,
-                )
-            else:
-                new_text_to_include = process.read_file(file_path, encoding)
+            new_text_to_include = read_file_or_url(
+                file_path, encoding, is_url=is_url,
+            )
 
             if start or end:
-                new_text_to_include, *expected_not_found = (
+                new_text_to_include, start_not_found, end_not_found = (
                     process.filter_inclusions(
                         start,
                         end,
                         new_text_to_include,
                     )
                 )
-                for i in range(2):
-                    if expected_but_any_found[i] and not expected_not_found[i]:
-                        expected_but_any_found[i] = False
+                if not start_not_found:
+                    expected_but_any_found[0] = False
+                if not end_not_found:
+                    expected_but_any_found[1] = False
 
             # nested includes
             if bool_options['recursive'].value:
@@ -261,6 +278,7 @@ def get_file_content(  # noqa: PLR0913, PLR0915
                     settings,
                     files_watcher=files_watcher,
                     http_cache=http_cache,
+                    files_contents=files_contents,
                 )
 
             # trailing newlines right stripping
@@ -270,59 +288,62 @@ def get_file_content(  # noqa: PLR0913, PLR0915
                 )
 
             if bool_options['dedent'].value:
-                new_text_to_include = textwrap.dedent(new_text_to_include)
+                new_text_to_include = process.dedent(new_text_to_include)
 
             # includer indentation preservation
             if bool_options['preserve-includer-indent'].value:
-                new_text_to_include = ''.join(
-                    includer_indent + line
-                    for line in (
-                        new_text_to_include.splitlines(keepends=True)
-                        or ['']
+                new_text_to_include = (
+                    includer_indent + process.indent_next_lines(
+                        new_text_to_include, includer_indent,
                     )
                 )
             else:
                 new_text_to_include = includer_indent + new_text_to_include
 
-            text_to_include += new_text_to_include
+            texts_to_include.append(new_text_to_include)
 
         # warn if expected start or ends haven't been found in included content
-        for i, delimiter_name in enumerate(['start', 'end']):
-            if expected_but_any_found[i]:
-                delimiter_value = locals()[delimiter_name]
-                readable_files_to_include = ', '.join([
-                    process.safe_os_path_relpath(fpath, docs_dir)
-                    for fpath in file_paths_to_include
-                ])
-                plural_suffix = 's' if len(file_paths_to_include) > 1 else ''
-                location = process.file_lineno_message(
-                    page_src_path, docs_dir, directive_lineno(),
-                )
-                logger.warning(
-                    f"Delimiter {delimiter_name} '{delimiter_value}'"
-                    f" of 'include' directive at {location}"
-                    f' not detected in the file{plural_suffix}'
-                    f' {readable_files_to_include}',
-                )
+        if any(expected_but_any_found):
+            readable_files_to_include = ', '.join([
+                process.safe_os_path_relpath(fpath, docs_dir)
+                for fpath in file_paths_to_include
+            ])
+            plural_suffix = 's' if len(file_paths_to_include) > 1 else ''
+            location = process.file_lineno_message(
+                page_src_path, docs_dir, directive_lineno(),
+            )
+            for delimiter_name, delimiter_value, delimiter_not_found in (
+                    ('start', start, expected_but_any_found[0]),
+                    ('end', end, expected_but_any_found[1]),
+            ):
+                if delimiter_not_found:
+                    logger.warning(
+                        f"Delimiter {delimiter_name} '{delimiter_value}'"
+                        f" of 'include' directive at {location}"
+                        f' not detected in the file{plural_suffix}'
+                        f' {readable_files_to_include}',
+                    )
 
         nonlocal new_found_include_contents
         include_index = len(new_found_include_contents)
         placeholder = build_placeholder(include_index, 'include')
-        new_found_include_contents.append((placeholder, text_to_include))
+        new_found_include_contents.append(
+            (placeholder, ''.join(texts_to_include)),
+        )
         return placeholder
 
     def found_include_markdown_tag(  # noqa: PLR0912, PLR0915
             match: re.Match[str],
     ) -> str:
         directive_match_start = match.start()
-        directive_lineno = functools.partial(
-            process.lineno_from_content_start,
-            markdown,
-            directive_match_start,
-        )
+
+        @functools.cache
+        def directive_lineno() -> int:
+            return process.lineno_from_content_start(
+                markdown, directive_match_start,
+            )
 
         includer_indent = match['_includer_indent']
-        empty_includer_indent = ' ' * len(includer_indent)
 
         filename, raw_filename = parse_filename_argument(match)
         if filename is None:
@@ -343,23 +364,23 @@ def get_file_content(  # noqa: PLR0913, PLR0915
             page_src_path,
             docs_dir,
         )
+        string_arguments = parse_string_arguments(arguments_string)
 
-        exclude_match = ARGUMENT_REGEXES['exclude']().search(arguments_string)
-        ignore_paths = [*settings_ignore_paths]
-        if exclude_match is not None:
-            exclude_string = parse_string_argument(exclude_match)
-            if exclude_string is None:
-                location = process.file_lineno_message(
-                    page_src_path, docs_dir, directive_lineno(),
-                )
-                raise PluginError(
-                    "Invalid empty 'exclude' argument in 'include-markdown'"
-                    f' directive at {location}',
-                )
-            for path in resolve_file_paths_to_exclude(
-                exclude_string, page_src_path, docs_dir,
-            ):
-                ignore_paths.append(path)
+        exclude_string = parse_string_argument_or_default(
+            string_arguments,
+            'exclude',
+            None,
+            'include-markdown',
+            directive_lineno,
+        )
+        ignore_paths = settings_ignore_paths
+        if exclude_string is not None:
+            ignore_paths = (
+                *settings_ignore_paths,
+                *resolve_file_paths_to_exclude(
+                    exclude_string, page_src_path, docs_dir,
+                ),
+            )
 
         file_paths_to_include, is_url = resolve_file_paths_to_include(
             filename,
@@ -380,11 +401,11 @@ def get_file_content(  # noqa: PLR0913, PLR0915
             files_watcher.included_files.extend(file_paths_to_include)
 
         bool_options, invalid_bool_args = parse_bool_options(
-            [
+            (
                 'rewrite-relative-urls', 'comments',
                 'preserve-includer-indent', 'dedent',
                 'trailing-newlines', 'recursive',
-            ],
+            ),
             defaults,
             arguments_string,
         )
@@ -399,52 +420,34 @@ def get_file_content(  # noqa: PLR0913, PLR0915
             )
 
         # start and end arguments
-        start_match = ARGUMENT_REGEXES['start']().search(arguments_string)
-        if start_match:
-            start = parse_string_argument(start_match)
-            if start is None:
-                location = process.file_lineno_message(
-                    page_src_path, docs_dir, directive_lineno(),
-                )
-                raise PluginError(
-                    "Invalid empty 'start' argument in 'include-markdown'"
-                    f' directive at {location}',
-                )
-        else:
-            start = defaults['start']
+        start = parse_string_argument_or_default(
+            string_arguments,
+            'start',
+            defaults['start'],
+            'include-markdown',
+            directive_lineno,
+        )
 
-        end_match = ARGUMENT_REGEXES['end']().search(arguments_string)
-        if end_match:
-            end = parse_string_argument(end_match)
-            if end is None:
-                location = process.file_lineno_message(
-                    page_src_path, docs_dir, directive_lineno(),
-                )
-                raise PluginError(
-                    "Invalid empty 'end' argument in 'include-markdown'"
-                    f' directive at {location}',
-                )
-        else:
-            end = defaults['end']
+        end = parse_string_argument_or_default(
+            string_arguments,
+            'end',
+            defaults['end'],
+            'include-markdown',
+            directive_lineno,
+        )
 
-        encoding_match = ARGUMENT_REGEXES['encoding']().search(
-            arguments_string)
-        if encoding_match:
-            encoding = parse_string_argument(encoding_match)
-            if encoding is None:
-                location = process.file_lineno_message(
-                    page_src_path, docs_dir, directive_lineno(),
-                )
-                raise PluginError(
-                    "Invalid empty 'encoding' argument in 'include-markdown'"
-                    f' directive at {location}',
-                )
-        else:
-            encoding = defaults['encoding']
+        encoding = parse_string_argument_or_default(
+            string_arguments,
+            'encoding',
+            defaults['encoding'],
+            'include-markdown',
+            directive_lineno,
+        )
 
         # heading offset
-        offset_match = ARGUMENT_REGEXES['heading-offset']().search(
-            arguments_string,
+        offset_match = (
+            ARGUMENT_REGEXES['heading-offset'].search(arguments_string)
+            if '=' in arguments_string else None
         )
         if offset_match:
             offset_raw_value = offset_match[1]
@@ -470,11 +473,19 @@ def get_file_content(  # noqa: PLR0913, PLR0915
             offset = defaults['heading-offset']
 
         separator = '\n' if bool_options['trailing-newlines'].value else ''
-        if not start and not end:
-            start_end_part = ''
-        else:
-            start_end_part = f"'{html.escape(start)}' " if start else "'' "
-            start_end_part += f"'{html.escape(end)}' " if end else "'' "
+        if bool_options['comments'].value:
+            # the same comment opens the contents of every included file
+            if not start and not end:
+                start_end_part = ''
+            else:
+                start_end_part = (
+                    f"'{html.escape(start)}' " if start else "'' "
+                )
+                start_end_part += f"'{html.escape(end)}' " if end else "'' "
+            begin_include_comment = (
+                f'<!-- BEGIN INCLUDE {html.escape(filename)}'
+                f' {start_end_part}-->'
+            )
 
         # if any start or end strings are found in the included content
         # but the arguments are specified, we must raise a warning
@@ -483,26 +494,30 @@ def get_file_content(  # noqa: PLR0913, PLR0915
         # but they have been specified, so the warning(s) must be raised
         expected_but_any_found = [start is not None, end is not None]
 
-        text_to_include = ''
+        # indentation prepended to the included lines after the first one
+        empty_includer_indent = (
+            ' ' * len(includer_indent)
+            if bool_options['preserve-includer-indent'].value else ''
+        )
+
+        texts_to_include: list[str] = []
         for file_path in file_paths_to_include:
-            if process.is_url(filename):
-                new_text_to_include = process.read_url(
-                    file_path, http_cache, encoding,
-                )
-            else:
-                new_text_to_include = process.read_file(file_path, encoding)
+            new_text_to_include = read_file_or_url(
+                file_path, encoding, is_url=is_url,
+            )
 
             if start or end:
-                new_text_to_include, *expected_not_found = (
+                new_text_to_include, start_not_found, end_not_found = (
                     process.filter_inclusions(
                         start,
                         end,
                         new_text_to_include,
                     )
                 )
-                for i in range(2):
-                    if expected_but_any_found[i] and not expected_not_found[i]:
-                        expected_but_any_found[i] = False
+                if not start_not_found:
+                    expected_but_any_found[0] = False
+                if not end_not_found:
+                    expected_but_any_found[1] = False
 
             # nested includes
             if bool_options['recursive'].value:
@@ -515,6 +530,7 @@ def get_file_content(  # noqa: PLR0913, PLR0915
                     settings,
                     files_watcher=files_watcher,
                     http_cache=http_cache,
+                    files_contents=files_contents,
                 )
 
             # trailing newlines right stripping
@@ -540,9 +556,8 @@ def get_file_content(  # noqa: PLR0913, PLR0915
             # comments
             if bool_options['comments'].value:
                 new_text_to_include = (
-                    f'{includer_indent}'
-                    f'<!-- BEGIN INCLUDE {html.escape(filename)}'
-                    f' {start_end_part}-->{separator}{new_text_to_include}'
+                    f'{includer_indent}{begin_include_comment}'
+                    f'{separator}{new_text_to_include}'
                     f'{separator}<!-- END INCLUDE -->'
                 )
             else:
@@ -552,16 +567,12 @@ def get_file_content(  # noqa: PLR0913, PLR0915
 
             # dedent
             if bool_options['dedent'].value:
-                new_text_to_include = textwrap.dedent(new_text_to_include)
+                new_text_to_include = process.dedent(new_text_to_include)
 
             # includer indentation preservation
-            if bool_options['preserve-includer-indent'].value:
-                new_text_to_include = ''.join(
-                    (empty_includer_indent if i > 0 else '') + line
-                    for i, line in enumerate(
-                        new_text_to_include.splitlines(keepends=True)
-                        or [''],
-                    )
+            if empty_includer_indent:
+                new_text_to_include = process.indent_next_lines(
+                    new_text_to_include, empty_includer_indent,
                 )
 
             if offset:
@@ -570,26 +581,29 @@ def get_file_content(  # noqa: PLR0913, PLR0915
                     offset=offset + cumulative_heading_offset,
                 )
 
-            text_to_include += new_text_to_include
+            texts_to_include.append(new_text_to_include)
 
         # warn if expected start or ends haven't been found in included content
-        for i, delimiter_name in enumerate(['start', 'end']):
-            if expected_but_any_found[i]:
-                delimiter_value = locals()[delimiter_name]
-                readable_files_to_include = ', '.join([
-                    process.safe_os_path_relpath(fpath, docs_dir)
-                    for fpath in file_paths_to_include
-                ])
-                plural_suffix = 's' if len(file_paths_to_include) > 1 else ''
-                location = process.file_lineno_message(
-                    page_src_path, docs_dir, directive_lineno(),
-                )
-                logger.warning(
-                    f"Delimiter {delimiter_name} '{delimiter_value}' of"
-                    f" 'include-markdown' directive at {location}"
-                    f' not detected in the file{plural_suffix}'
-                    f' {readable_files_to_include}',
-                )
+        if any(expected_but_any_found):
+            readable_files_to_include = ', '.join([
+                process.safe_os_path_relpath(fpath, docs_dir)
+                for fpath in file_paths_to_include
+            ])
+            plural_suffix = 's' if len(file_paths_to_include) > 1 else ''
+            location = process.file_lineno_message(
+                page_src_path, docs_dir, directive_lineno(),
+            )
+            for delimiter_name, delimiter_value, delimiter_not_found in (
+                    ('start', start, expected_but_any_found[0]),
+                    ('end', end, expected_but_any_found[1]),
+            ):
+                if delimiter_not_found:
+                    logger.warning(
+                        f"Delimiter {delimiter_name} '{delimiter_value}' of"
+                        f" 'include-markdown' directive at {location}"
+                        f' not detected in the file{plural_suffix}'
+                        f' {readable_files_to_include}',
+                    )
 
         nonlocal new_found_include_markdown_contents
         markdown_include_index = len(new_found_include_markdown_contents)
@@ -597,27 +611,37 @@ def get_file_content(  # noqa: PLR0913, PLR0915
             markdown_include_index, 'include-markdown',
         )
         new_found_include_markdown_contents.append(
-            (placeholder, text_to_include),
+            (placeholder, ''.join(texts_to_include)),
         )
         return placeholder
 
-    # Replace contents by placeholders
-    markdown = tags['include-markdown'].sub(
-        found_include_markdown_tag,
+    def found_include_or_include_markdown_tag(match: re.Match[str]) -> str:
+        if match['include_markdown_directive'] is None:
+            return found_include_tag(match)
+        return found_include_markdown_tag(match)
+
+    # Replace contents by placeholders, matching both directives in the
+    # same pass over the markdown
+    markdown = tags['include-or-include-markdown'].sub(
+        found_include_or_include_markdown_tag,
         markdown,
     )
-    markdown = tags['include'].sub(
-        found_include_tag,
+
+    if not (
+            new_found_include_contents
+            or new_found_include_markdown_contents
+    ):
+        return markdown
+
+    # Replace placeholders by contents in a single pass. Each placeholder
+    # is replaced only once, so repeated or unknown ones are left as is
+    placeholders_contents = dict(new_found_include_contents)
+    placeholders_contents.update(new_found_include_markdown_contents)
+    return PLACEHOLDER_RE.sub(
+        lambda match: placeholders_contents.pop(match[0], match[0]),
         markdown,
     )
 
-    # Replace placeholders by contents
-    for placeholder, text in new_found_include_contents:
-        markdown = markdown.replace(placeholder, text, 1)
-    for placeholder, text in new_found_include_markdown_contents:
-        markdown = markdown.replace(placeholder, text, 1)
-    return markdown
-
 
 def on_page_markdown(
         markdown: str,
@@ -633,15 +657,15 @@ def on_page_markdown(
         page.file.abs_src_path,
         docs_dir,
         {
-            'include': create_include_tag(
-                config.opening_tag,
-                config.closing_tag,
-                config.directives.get('include', 'include'),
-            ),
-            'include-markdown': create_include_tag(
-                config.opening_tag,
-                config.closing_tag,
-                config.directives.get('include-markdown', 'include-markdown'),
+            'include-or-include-markdown': (
+                create_include_or_include_markdown_tag(
+                    config.opening_tag,
+                    config.closing_tag,
+                    config.directives.get('include', 'include'),
+                    config.directives.get(
+                        'include-markdown', 'include-markdown',
+                    ),
+                )
             ),
         },
         {
@@ -657,8 +681,13 @@ def on_page_markdown(
             'end': config.end,
         },
         Settings(
-            exclude=config.exclude,
+            ignore_paths=resolve_file_paths_to_exclude_from_settings(
+                tuple(config.exclude),
+                docs_dir,
+            ),
+            opening_tag=config.opening_tag,
         ),
         files_watcher=plugin._files_watcher,
         http_cache=plugin._cache or http_cache,
+        files_contents=plugin._files_contents,
     )
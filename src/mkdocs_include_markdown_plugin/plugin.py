@@ -19,6 +19,7 @@ if TYPE_CHECKING:  # pragma: no cover
 
 from mkdocs_include_markdown_plugin.cache import Cache, initialize_cache
 from mkdocs_include_markdown_plugin.config import PluginConfig
+from mkdocs_include_markdown_plugin.directive import clear_file_paths_caches
 from mkdocs_include_markdown_plugin.event import (
     on_page_markdown as _on_page_markdown,
 )
@@ -52,10 +53,28 @@ class IncludeMarkdownPlugin(BasePlugin[PluginConfig]):
 
         return config
 
+    def on_files(
+            self,
+            files: Files,
+            config: MkDocsConfig,  # noqa: ARG002
+    ) -> Files:
+        # files can be added, removed or edited between builds when serving
+        clear_file_paths_caches()
+        self._files_contents.clear()
+        return files
+
     @cached_property
     def _files_watcher(self) -> FilesWatcher:
         return FilesWatcher()
 
+    @cached_property
+    def _files_contents(self) -> dict[tuple[str, str], str]:
+        """Contents of the included files by path and encoding.
+
+        Shared by all the pages of a build, so each file is read only once.
+        """
+        return {}
+
     def _update_watched_files(self) -> None:  # pragma: no cover
         """Function executed on server reload.
 
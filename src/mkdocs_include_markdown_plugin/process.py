@@ -7,7 +7,8 @@ import io
 import os
 import re
 import stat
-from collections.abc import Callable, Iterator
+import textwrap
+from collections.abc import Callable, Iterator, Sequence
 from typing import TYPE_CHECKING
 
 
@@ -422,14 +423,33 @@ def increase_headings_offset(markdown: str, offset: int = 0) -> str:
 
 def rstrip_trailing_newlines(content: str) -> str:
     """Removes trailing newlines from a string."""
-    while content.endswith(('\n', '\r')):
-        content = content.rstrip('\r\n')
+    return content.rstrip('\r\n')
+
+
+def dedent(content: str) -> str:
+    """Remove any common leading whitespace from every line of a string."""
+    if content[:1] not in (' ', '\t') and (
+            '\n ' not in content and '\n\t' not in content
+    ):
+        # no line starts with whitespace, so there is nothing to remove
+        return content
+    return textwrap.dedent(content)
+
+
+def indent_next_lines(content: str, indent: str) -> str:
+    """Prepend an indentation to all the lines of a string but the first."""
+    if not indent:
+        return content
+    content = content.replace('\n', f'\n{indent}')
+    if content.endswith(f'\n{indent}'):
+        # don't indent the empty line after a trailing newline
+        content = content[:-len(indent)]
     return content
 
 
 def filter_paths(
         filepaths: Iterator[str] | list[str],
-        ignore_paths: list[str],
+        ignore_paths: Sequence[str],
 ) -> list[str]:
     """Filters a list of paths removing those defined in other list of paths.
 
@@ -448,16 +468,19 @@ def filter_paths(
     Returns:
         list: Non filtered paths ordered alphabetically.
     """
+    # exclude globs can resolve to many paths, so lookups must not be
+    # linear in their number
+    ignore_paths_set = set(ignore_paths)
     response = []
     for filepath in filepaths:
         # ignore by filepath
-        if filepath in ignore_paths:
+        if filepath in ignore_paths_set:
             continue
 
         # ignore by dirpath (relative or absolute)
         fp_split = filepath.split(os.sep)
         fp_split.pop()
-        if (os.sep).join(fp_split) in ignore_paths:
+        if (os.sep).join(fp_split) in ignore_paths_set:
             continue
 
         # ignore if is a directory
@@ -552,4 +575,4 @@ def file_lineno_message(
 
 def lineno_from_content_start(content: str, start: int) -> int:
     """Return the line number of the first line of ``start`` in ``content``."""
-    return content[:start].count('\n') + 1
+    return content.count('\n', 0, start) + 1
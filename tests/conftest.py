@@ -11,6 +11,16 @@ for d in (SRC_DIR, TESTS_DIR):
         sys.path.insert(0, d)
 
 from mkdocs_include_markdown_plugin import IncludeMarkdownPlugin  # noqa: E402
+from mkdocs_include_markdown_plugin.directive import (  # noqa: E402
+    clear_file_paths_caches,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clear_file_paths_caches():
+    """Don't share resolved file paths between tests."""
+    yield
+    clear_file_paths_caches()
 
 
 @pytest.fixture
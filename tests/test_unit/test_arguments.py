@@ -91,6 +91,34 @@ More content that should be ignored
     assert caplog.records == []
 
 
+@parametrize_directives
+def test_argument_names_inside_quoted_values(
+    directive, page, caplog, tmp_path, plugin,
+):
+    page_to_include_filepath = tmp_path / 'included.md'
+    page_to_include_filepath.write_text('''Content that should be ignored
+<!-- start end=x -->
+Content to include
+<!-- end start=y -->
+More content that should be ignored
+''')
+
+    includer_file_content = f'''{{%
+  {directive} "{page_to_include_filepath}"
+  start="<!-- start end=x -->"
+  end="<!-- end start=y -->"
+%}}'''
+    result = on_page_markdown(
+        includer_file_content,
+        page(tmp_path / 'includer.md'),
+        tmp_path,
+        plugin,
+    )
+    assert result == '\nContent to include\n'
+
+    assert caplog.records == []
+
+
 @pytest.mark.parametrize('argument', ('start', 'end'))
 @parametrize_directives
 def test_invalid_start_end_arguments(
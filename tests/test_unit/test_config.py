@@ -88,6 +88,20 @@ def _run_test(
             {'opening_tag': '.^$*+-?{}[]\\|():<>=!/#%,;', 'closing_tag': '}'},
             id='custom-tag-all-escaped-char',
         ),
+        pytest.param(
+            '{% include "{filepath}" end{% include "{filepath}" end\n',
+            'foo',
+            'foofoo\n',
+            {'closing_tag': 'end'},
+            id='custom-closing-tag-word-characters',
+        ),
+        pytest.param(
+            'x {% include "{filepath}" endbar {% include "{filepath}" end\n',
+            'foo',
+            'x foobar foo\n',
+            {'closing_tag': 'end'},
+            id='custom-closing-tag-word-characters-indented',
+        ),
 
         # preserve_includer_indent
         pytest.param(
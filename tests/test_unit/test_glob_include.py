@@ -215,3 +215,25 @@ This 02 must appear only without specifying end.
     for record in caplog.records:
         assert record.msg in expected_warnings
     assert len(expected_warnings_schemas) == len(caplog.records)
+
+
+@unix_only
+@parametrize_directives
+def test_glob_include_cache_cleared_between_builds(
+    directive, page, tmp_path, plugin,
+):
+    includer_file = tmp_path / 'includer.txt'
+    (tmp_path / 'included_01.txt').write_text('bar')
+
+    includer_file_content = f'{{% {directive} "./included*.txt" %}}'
+
+    assert on_page_markdown(
+        includer_file_content, page(includer_file), tmp_path, plugin,
+    ) == 'bar'
+
+    # new files are found after the start of a new build
+    (tmp_path / 'included_02.txt').write_text('baz')
+    plugin.on_files([], None)
+    assert on_page_markdown(
+        includer_file_content, page(includer_file), tmp_path, plugin,
+    ) == 'barbaz'
@@ -1,5 +1,7 @@
 """``include`` directive tests."""
 
+import time
+
 import pytest
 
 from mkdocs_include_markdown_plugin.event import on_page_markdown
@@ -399,3 +401,48 @@ def test_include(
     for record in caplog.records:
         assert record.msg in expected_warnings
     assert len(expected_warnings_schemas) == len(caplog.records)
+
+
+def test_include_contents_read_once_per_build(page, tmp_path, plugin):
+    included_file = tmp_path / 'included.txt'
+    included_file.write_text('bar')
+
+    includer_file_content = f'{{% include "{included_file.as_posix()}" %}}'
+
+    for includer_filename in ('includer_01.txt', 'includer_02.txt'):
+        assert on_page_markdown(
+            includer_file_content,
+            page(tmp_path / includer_filename),
+            tmp_path,
+            plugin,
+        ) == 'bar'
+        # later edits are not seen until the next build
+        included_file.write_text('baz')
+
+    plugin.on_files([], None)
+    assert on_page_markdown(
+        includer_file_content,
+        page(tmp_path / 'includer_01.txt'),
+        tmp_path,
+        plugin,
+    ) == 'baz'
+
+
+def test_include_long_line_without_tag(page, tmp_path, plugin):
+    included_file = tmp_path / 'included.txt'
+    included_file.write_text('bar')
+
+    # the indentation of the directive must not be searched from every
+    # position of a long run of word characters, which is quadratic
+    includer_file_content = (
+        f'{"a" * 20000}\n{{% include "{included_file.as_posix()}" %}}'
+    )
+
+    start_time = time.perf_counter()
+    assert on_page_markdown(
+        includer_file_content,
+        page(tmp_path / 'includer.txt'),
+        tmp_path,
+        plugin,
+    ) == f'{"a" * 20000}\nbar'
+    assert time.perf_counter() - start_time < 1
@@ -908,3 +908,17 @@ Another
     assert on_page_markdown(
         includer_content, page(includer_file), tmp_path, plugin,
     ) == expected_result
+
+
+def test_include_and_include_markdown_mixed(page, tmp_path, plugin):
+    includer_file = tmp_path / 'includer.md'
+    (tmp_path / 'included.md').write_text('bar')
+
+    includer_file_content = '''{% include-markdown "./included.md" %}
+  {% include "./included.md" %} {% include-markdown "./included.md" %}
+{% include "./included.md" %}
+'''
+
+    assert on_page_markdown(
+        includer_file_content, page(includer_file), tmp_path, plugin,
+    ) == 'bar\n  bar bar\nbar\n'
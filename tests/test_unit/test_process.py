@@ -4,7 +4,9 @@ import pytest
 
 from mkdocs_include_markdown_plugin.cache import Cache
 from mkdocs_include_markdown_plugin.process import (
+    dedent,
     increase_headings_offset,
+    indent_next_lines,
     read_url,
     rewrite_relative_urls,
 )
@@ -395,6 +397,42 @@ def test_dont_increase_heading_offset_inside_fenced_codeblocks(
     assert increase_headings_offset(markdown, offset=offset) == expected_result
 
 
+@pytest.mark.parametrize(
+    ('content', 'expected_result'),
+    (
+        pytest.param('', '', id='empty'),
+        pytest.param('foo\nbar\n', 'foo\nbar\n', id='not-indented'),
+        pytest.param('  foo\n  bar\n', 'foo\nbar\n', id='indented'),
+        pytest.param('foo\n  bar\n', 'foo\n  bar\n', id='partially-indented'),
+        pytest.param('\tfoo\n\tbar', 'foo\nbar', id='tabs'),
+        pytest.param(
+            'foo\n  \nbar\n', 'foo\n\nbar\n', id='whitespace-only-line',
+        ),
+    ),
+)
+def test_dedent(content, expected_result):
+    assert dedent(content) == expected_result
+
+
+@pytest.mark.parametrize(
+    ('content', 'indent', 'expected_result'),
+    (
+        pytest.param('', '  ', '', id='empty'),
+        pytest.param('foo', '  ', 'foo', id='single-line'),
+        pytest.param('foo\n', '  ', 'foo\n', id='trailing-newline'),
+        pytest.param('foo  ', '  ', 'foo  ', id='trailing-indent'),
+        pytest.param(
+            'foo\nbar\n\nbaz\n', '  ', 'foo\n  bar\n  \n  baz\n',
+            id='multiple-lines',
+        ),
+        pytest.param('foo\r\nbar', '\t', 'foo\r\n\tbar', id='crlf'),
+        pytest.param('foo\nbar', '', 'foo\nbar', id='empty-indent'),
+    ),
+)
+def test_indent_next_lines(content, indent, expected_result):
+    assert indent_next_lines(content, indent) == expected_result
+
+
 def test_read_url_cached_content(tmp_path):
     url = (
         'https://raw.githubusercontent.com/mondeja/'